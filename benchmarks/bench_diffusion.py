@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from timeit import repeat
+from typing import Callable
+
+import numpy as np
+from pygame import Vector2
+
+from game.core.diffusion import DiffusionField
+
+SIZES = [100, 250, 500, 1000]
+DELTA_TIME = 1 / 60
+TICKS = 50
+
+
+def hot_spot(size: int) -> DiffusionField:
+    field = DiffusionField(Vector2(size, size), rate=2.0, initial=21.0)
+    field.step(DELTA_TIME)
+    field.set(size // 2, size // 2, 1000.0)
+    return field
+
+
+def full_map(size: int) -> DiffusionField:
+    field = DiffusionField(Vector2(size, size), rate=2.0)
+    field.values[:] = np.random.default_rng(0).uniform(0, 40, (size, size))
+    return field
+
+
+def equilibrium(size: int) -> DiffusionField:
+    field = DiffusionField(Vector2(size, size), rate=2.0, initial=21.0)
+    field.step(DELTA_TIME)
+    return field
+
+
+def bench(setup: Callable[[int], DiffusionField], size: int) -> float:
+    field = setup(size)
+    timings = repeat(lambda: field.step(DELTA_TIME), number=TICKS, repeat=3)
+    return min(timings) / TICKS * 1000
+
+
+if __name__ == "__main__":
+    print(f"{'size':>6} {'hot spot':>12} {'full map':>12} {'equilibrium':>12}  (ms/tick)")
+    for size in SIZES:
+        results = [bench(setup, size) for setup in (hot_spot, full_map, equilibrium)]
+        print(f"{size:>6}" + "".join(f"{result:>12.3f}" for result in results))
@@ -27,6 +27,8 @@ class BuildingMeta(DataclassInheritance):
 
 class Building(Eventful, metaclass=BuildingMeta):
     sprite: Sprite = AbstractProperty()
+    impassable: bool = False
+    tiled: bool = False  # Drawn into the background tiles instead of the foreground
 
     Place = Event()
     Remove = Event()
@@ -41,6 +43,9 @@ class Building(Eventful, metaclass=BuildingMeta):
 
         self.dispatch_event("CreateBuilding")
 
+    def tick(self: Building, delta_time: float) -> None:
+        pass
+
 
 class BreakableBuilding(Building):
     max_durability: float = AbstractProperty()
@@ -59,3 +64,7 @@ class BreakableBuilding(Building):
     def repair(self: Building, repair_amount: float) -> None:
         self.data.durability += repair_amount
         self.dispatch_event("Repair", repair_amount)
+
+
+class SimpleBuilding(Building):
+    speed_modifier: float = AbstractProperty()
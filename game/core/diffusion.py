@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from math import ceil
+
+import numpy as np
+from pygame import Vector2
+
+from .globals import REGION_SIZE
+
+
+class DiffusionField:
+    """
+    Float field diffused between open cells with an explicit vectorized step.
+    Cells are grouped in chunks, and chunks where no two open neighbours
+    differ by more than tolerance are skipped until a neighbouring chunk or a
+    write wakes them up
+    """
+
+    def __init__(
+        self: DiffusionField,
+        size: Vector2,
+        *,
+        rate: float,
+        initial: float = 0.0,
+        chunk_size: int = REGION_SIZE,
+        tolerance: float = 1e-3,
+        max_step: float = 0.2,  # Explicit scheme is unstable past 0.25
+    ) -> None:
+        self.width = int(size.x)
+        self.height = int(size.y)
+        self.rate = rate
+        self.chunk_size = chunk_size
+        self.tolerance = tolerance
+        self.max_step = max_step
+
+        chunks_y = -(-self.height // chunk_size)
+        chunks_x = -(-self.width // chunk_size)
+        padded_shape = (chunks_y * chunk_size, chunks_x * chunk_size)
+
+        # Padding cells are closed so chunks can be reshaped into blocks
+        self.padded_values = np.full(padded_shape, initial, dtype=np.float32)
+        self.open = np.zeros(padded_shape, dtype=bool)
+        self.open[: self.height, : self.width] = True
+        self.values = self.padded_values[: self.height, : self.width]
+
+        self.active = np.ones((chunks_y, chunks_x), dtype=bool)
+
+    def wake(self: DiffusionField, x: int, y: int) -> None:
+        self.active[y // self.chunk_size, x // self.chunk_size] = True
+
+    def set(self: DiffusionField, x: int, y: int, value: float) -> None:
+        self.values[y, x] = value
+        self.wake(x, y)
+
+    def set_open(self: DiffusionField, x: int, y: int, is_open: bool) -> None:
+        self.open[y, x] = is_open
+        self.wake(x, y)
+
+    def step(self: DiffusionField, delta_time: float) -> None:
+        amount = self.rate * delta_time
+        substeps = max(1, ceil(amount / self.max_step))
+
+        for _ in range(substeps):
+            if not self.active.any():
+                return
+            self.substep(amount / substeps)
+
+    def substep(self: DiffusionField, amount: float) -> None:
+        cs = self.chunk_size
+
+        # Neighbours of active chunks wake up first so they receive their flux
+        awake = self.active
+        self.active = awake.copy()
+        self.active[1:, :] |= awake[:-1, :]
+        self.active[:-1, :] |= awake[1:, :]
+        self.active[:, 1:] |= awake[:, :-1]
+        self.active[:, :-1] |= awake[:, 1:]
+
+        rows = np.flatnonzero(self.active.any(axis=1))
+        cols = np.flatnonzero(self.active.any(axis=0))
+        cy0, cy1 = rows[0], rows[-1] + 1
+        cx0, cx1 = cols[0], cols[-1] + 1
+        y0, y1 = cy0 * cs, cy1 * cs
+        x0, x1 = cx0 * cs, cx1 * cs
+
+        # Flux only crosses faces between two open cells of awake chunks,
+        # which keeps the total conserved at the border of sleeping chunks
+        active = self.active[cy0:cy1, cx0:cx1]
+        is_open = self.open[y0:y1, x0:x1]
+        conducts = is_open & np.repeat(np.repeat(active, cs, 0), cs, 1)
+        values = self.padded_values[y0:y1, x0:x1]
+
+        diff_x = values[:, 1:] - values[:, :-1]
+        diff_y = values[1:, :] - values[:-1, :]
+
+        # Chunks sleep by how far they are from level, independent of the step
+        # size. Each face counts for its left or top cell, chunks past a face
+        # are woken up by the neighbour spread above
+        gap = np.zeros_like(values)
+        np.abs(diff_x, out=gap[:, :-1], where=is_open[:, 1:] & is_open[:, :-1])
+        np.maximum(
+            gap[:-1, :],
+            np.abs(diff_y),
+            out=gap[:-1, :],
+            where=is_open[1:, :] & is_open[:-1, :],
+        )
+
+        delta = np.zeros_like(values)
+        flux_x = diff_x * (conducts[:, 1:] & conducts[:, :-1])
+        delta[:, :-1] += flux_x
+        delta[:, 1:] -= flux_x
+        flux_y = diff_y * (conducts[1:, :] & conducts[:-1, :])
+        delta[:-1, :] += flux_y
+        delta[1:, :] -= flux_y
+        delta *= amount
+        values += delta
+
+        blocks = gap.reshape(cy1 - cy0, cs, cx1 - cx0, cs)
+        self.active = np.zeros_like(self.active)
+        self.active[cy0:cy1, cx0:cx1] = blocks.max(axis=(1, 3)) > self.tolerance
@@ -1,5 +1,7 @@
 from math import sqrt
 
 TILE_SIZE = 32
+REGION_SIZE = 12
+MAX_CATCHUP_STEPS = 10
 ALPHA_COLOR = (255, 0, 255)
 SQRT_2_OVER_2 = sqrt(2) / 2
\ No newline at end of file
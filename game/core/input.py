@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import pygame as pg
+from pygame.event import EventType
+
+
+def merge_motion(first: EventType, second: EventType) -> EventType:
+    rel = (first.rel[0] + second.rel[0], first.rel[1] + second.rel[1])
+    return pg.event.Event(pg.MOUSEMOTION, {**second.dict, "rel": rel})
+
+
+def merge_wheel(first: EventType, second: EventType) -> EventType:
+    return pg.event.Event(
+        pg.MOUSEWHEEL, {**second.dict, "x": first.x + second.x, "y": first.y + second.y}
+    )
+
+
+def coalesce_events(events: list[EventType]) -> list[EventType]:
+    """
+    Merges runs of consecutive mouse motion (with the same buttons held) and
+    wheel events into a single event each, keeping the order of everything else
+    """
+    coalesced: list[EventType] = []
+
+    for event in events:
+        previous = coalesced[-1] if coalesced else None
+
+        if (
+            event.type == pg.MOUSEMOTION
+            and previous is not None
+            and previous.type == pg.MOUSEMOTION
+            and previous.buttons == event.buttons
+        ):
+            coalesced[-1] = merge_motion(previous, event)
+        elif (
+            event.type == pg.MOUSEWHEEL
+            and previous is not None
+            and previous.type == pg.MOUSEWHEEL
+        ):
+            coalesced[-1] = merge_wheel(previous, event)
+        else:
+            coalesced.append(event)
+
+    return coalesced
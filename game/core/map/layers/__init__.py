@@ -1 +1 @@
-__all__ = ["map_layer", "building_layer"]
+__all__ = ["map_layer", "building_layer", "field_layer"]
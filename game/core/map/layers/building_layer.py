@@ -13,30 +13,39 @@ class BuildingLayer(TickableLayer[Optional[Building]]):
 
     def tick(self: BuildingLayer, delta_time: float) -> None:
         for building in self.data:
-            building.tick(delta_time)
-    
+            if building is not None:
+                building.tick(delta_time)
+
+    def is_passable(self: BuildingLayer, index: int) -> bool:
+        building = self.data[index]
+        return building is None or not building.impassable
+
     def add_building(self: BuildingLayer, pos: Vector2, building: Building) -> None:
-        if isinstance(building.type, SimpleBuilding):
-            self.set_pos(pos, building)
-
-            self.map.layers["speed_modifiers"].add_modifiers(
-                pos, "building", building.type.speed_modifier
-            )
-
-            if isinstance(building.sprite, TileSprite):
-                self.map.layers["background_sprites"].redraw_pos(pos)
-            else:
-                self.map.layers["foreground_sprites"].set_pos(pos, building.sprite)
-    
+        self.set_pos(pos, building)
+
+        if isinstance(building, SimpleBuilding):
+            if (speed_modifiers := self.map.layers.get("speed_modifiers")) is not None:
+                speed_modifiers.add_modifiers(pos, "building", building.speed_modifier)
+
+        self.update_sprites(pos, building)
+
     def remove_building(self: BuildingLayer, pos: Vector2) -> None:
         building = self.get_pos(pos)
         assert building is not None
-        if isinstance(building.type, SimpleBuilding):
-            self.set_pos(pos, None)
-
-            self.map.layers["speed_modifiers"].remove_modifier(pos, "building")
-
-            if isinstance(building.sprite, TileSprite):
-                self.map.layers["background_sprites"].redraw_pos(pos)
-            else:
-                self.map.layers["foreground_sprites"].set_pos(pos, None)
+        self.set_pos(pos, None)
+
+        if isinstance(building, SimpleBuilding):
+            if (speed_modifiers := self.map.layers.get("speed_modifiers")) is not None:
+                speed_modifiers.remove_modifier(pos, "building")
+
+        self.update_sprites(pos, building, removed=True)
+
+    def update_sprites(
+        self: BuildingLayer, pos: Vector2, building: Building, *, removed: bool = False
+    ) -> None:
+        # Sprite layers are optional, maps without them only track the buildings
+        if building.tiled:
+            if (background := self.map.layers.get("background_sprites")) is not None:
+                background.redraw_pos(pos)
+        elif (foreground := self.map.layers.get("foreground_sprites")) is not None:
+            foreground.set_pos(pos, None if removed else building.sprite)
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from pygame import Vector2
+
+from ...diffusion import DiffusionField
+from .map_layer import LayerChanges, TickableLayer
+
+
+class FieldLayer(TickableLayer[float]):
+    """
+    Layer holding a float value per cell that diffuses every tick,
+    blocked by impassable buildings
+    """
+
+    default_elem = 0.0
+    diffusion_rate: float = 1.0
+
+    def create_data(self: FieldLayer) -> DiffusionField:
+        return DiffusionField(
+            self.map.size, rate=type(self).diffusion_rate, initial=type(self).default_elem
+        )
+
+    def connect(self: FieldLayer) -> None:
+        buildings = self.map.layers["buildings"]
+        for index in range(len(buildings.data)):
+            if not buildings.is_passable(index):
+                self.set_open(index, False)
+
+        buildings.subscribe(self.update_walls)
+
+    def update_walls(self: FieldLayer, changes: LayerChanges) -> None:
+        for index in changes.indices:
+            self.set_open(index, changes.layer.is_passable(index))
+
+    def set_open(self: FieldLayer, index: int, is_open: bool) -> None:
+        width = int(self.map.size.x)
+        self.data.set_open(index % width, index // width, is_open)
+
+    def get_pos(self: FieldLayer, pos: Vector2) -> float:
+        return float(self.data.values[int(pos.y), int(pos.x)])
+
+    def set_pos(self: FieldLayer, pos: Vector2, value: float) -> None:
+        self.data.set(int(pos.x), int(pos.y), value)
+        self.mark_dirty(pos)
+
+    def tick(self: FieldLayer, delta_time: float) -> None:
+        # Diffusion changes are not journaled, they touch most active cells
+        self.data.step(delta_time)
+
+
+class TemperatureLayer(FieldLayer):
+    __layer_name__ = "temperature"
+    default_elem = 21.0
+    diffusion_rate = 2.0
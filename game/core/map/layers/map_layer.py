@@ -2,13 +2,41 @@ from __future__ import annotations
 
 import inspect
 from abc import ABC, ABCMeta, abstractmethod, abstractstaticmethod
+from dataclasses import dataclass
 from typing import Any, Callable, Generic, Optional, TypeVar
 
-from pygame import Vector2
+from pygame import Rect, Vector2
+
+from ...scheduling import TICK_RATE_NORMAL
 
 T = TypeVar("T")
 
 
+@dataclass(frozen=True)
+class LayerChanges:
+    """
+    Batch of cells written to a layer since the last flush
+    """
+
+    layer: MapLayer
+    version: int
+    indices: frozenset[int]
+
+    def positions(self: LayerChanges) -> list[Vector2]:
+        width = int(self.layer.map.size.x)
+        return [Vector2(index % width, index // width) for index in self.indices]
+
+    @property
+    def bounds(self: LayerChanges) -> Rect:
+        width = int(self.layer.map.size.x)
+        xs = [index % width for index in self.indices]
+        ys = [index // width for index in self.indices]
+        return Rect(min(xs), min(ys), max(xs) - min(xs) + 1, max(ys) - min(ys) + 1)
+
+
+LayerSubscriber = Callable[[LayerChanges], None]
+
+
 class LayerMeta(ABCMeta):
     layers: dict[str, type[MapLayer]] = {}
 
@@ -38,26 +66,77 @@ class MapLayer(ABC, Generic[T], metaclass=LayerMeta):
 
     def __init__(self: MapLayer[T], map: Map) -> None:
         self.map = map
+        self.data = self.create_data()
 
-        self.data: list[T]
+        self.version = 0
+        self.dirty: set[int] = set()
+        self.subscribers: list[LayerSubscriber] = []
+
+    def create_data(self: MapLayer[T]) -> list[T]:
         if type(self).default_factory is None:
-            self.data = [
+            return [
                 type(self).default_elem
                 for _ in range(int(self.map.size.x * self.map.size.y))
             ]
         else:
-            self.data = [
+            return [
                 type(self).default_factory()
                 for _ in range(int(self.map.size.x * self.map.size.y))
             ]
-    
+
+    def connect(self: MapLayer[T]) -> None:
+        """
+        Called once every layer of the map exists, to subscribe to siblings
+        """
+        pass
+
+    def pos_index(self: MapLayer[T], pos: Vector2) -> int:
+        return int(pos.x + self.map.size.x * pos.y)
+
     def get_pos(self: MapLayer[T], pos: Vector2) -> T:
-        return self.data[int(pos.x + self.map.size.x * pos.y)]
-    
+        return self.data[self.pos_index(pos)]
+
     def set_pos(self: MapLayer[T], pos: Vector2, value: T) -> None:
-        self.data[int(pos.x + self.map.size.x * pos.y)] = value
+        self.data[self.pos_index(pos)] = value
+        self.mark_dirty(pos)
+
+    def mark_dirty(self: MapLayer[T], pos: Vector2) -> None:
+        """
+        Records a change to the cell at pos, for values mutated in place
+        """
+        self.dirty.add(self.pos_index(pos))
+        self.version += 1
+
+    def subscribe(self: MapLayer[T], subscriber: LayerSubscriber) -> None:
+        self.subscribers.append(subscriber)
+
+    def unsubscribe(self: MapLayer[T], subscriber: LayerSubscriber) -> None:
+        self.subscribers.remove(subscriber)
+
+    def peek_changes(self: MapLayer[T]) -> LayerChanges:
+        """
+        Returns the cells changed since the last flush without delivering them
+        """
+        return LayerChanges(self, self.version, frozenset(self.dirty))
+
+    def flush_changes(self: MapLayer[T]) -> None:
+        """
+        Delivers the cells changed since the last flush to every subscriber.
+        Called by the map once per tick, or earlier by anyone needing fresh data
+        """
+        if not self.dirty:
+            return
+
+        changes = LayerChanges(self, self.version, frozenset(self.dirty))
+        self.dirty.clear()
+
+        for subscriber in self.subscribers:
+            subscriber(changes)
+
 
 class TickableLayer(MapLayer[T]):
+    tick_rate: int = TICK_RATE_NORMAL
+
     @abstractmethod
     def tick(self: TickableLayer[T], delta_time: float) -> None:
         pass
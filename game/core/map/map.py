@@ -3,7 +3,7 @@ from __future__ import annotations
 from copy import copy
 from math import floor
 from numbers import Real
-from typing import Optional
+from typing import Any, Callable, Optional
 from uuid import uuid4
 
 import pygame as pg
@@ -12,6 +12,8 @@ from pygame.event import EventType
 
 from ..globals import TILE_SIZE
 from ..location import Location
+from ..regions import RegionGrid
+from ..scheduling import TickScheduler, Timer
 from ..view import View
 from .layers import *
 from .layers.map_layer import LayerMeta, TickableLayer
@@ -21,9 +23,25 @@ class Map:
     def __init__(self: Map, size: Vector2) -> None:
         self.size = size
         self.entities: dict[str, Entity] = {}
-        self.layers = {name: layer(self) for name, layer in LayerMeta.layers}
+        self.layers = {name: layer(self) for name, layer in LayerMeta.layers.items()}
+        for layer in self.layers.values():
+            layer.connect()
+
+        self.tickable_layers = [
+            layer for layer in self.layers.values() if isinstance(layer, TickableLayer)
+        ]
+        self.scheduler = TickScheduler()
+        for layer in self.tickable_layers:
+            self.scheduler.add(layer)
+
+        buildings = self.layers["buildings"]
+        self.regions = RegionGrid(
+            self.size, buildings.is_passable, peek=buildings.peek_changes
+        )
+        buildings.subscribe(self.regions.handle_changes)
+
         self.id = uuid4()
-        self.view = MapView()
+        self.views: list[View] = []
 
     def in_bounds(self: Map, pos: Vector2) -> bool:
         return 0 <= pos.x < self.size.x and 0 <= pos.y < self.size.y
@@ -31,20 +49,34 @@ class Map:
     def print_info(self: Map, pos: Vector2) -> None:
         pass
 
+    def request_redraw(self: Map) -> None:
+        for view in self.views:
+            view.request_redraw()
+
     def tick(self: Map, delta_time: float) -> None:
-        for layer in filter(
-            lambda l: isinstance(l, TickableLayer), self.layers.values()
-        ):
-            layer.tick(delta_time)
+        self.scheduler.tick(delta_time)
 
-        for entity in self.entities.values():
-            entity.tick(delta_time)
+        for layer in self.layers.values():
+            layer.flush_changes()
 
     def add_entity(self: "Map", entity: Entity) -> None:
         self.entities[entity.id] = entity
+        self.scheduler.add(entity)
+        self.request_redraw()
 
     def remove_entity(self: "Map", entity: Entity) -> None:
         del self.entities[entity.id]
+        self.scheduler.remove(entity)
+        self.request_redraw()
+
+    def move_entity(self: Map, entity: Entity, position: Vector2) -> None:
+        entity.data["location"].position = position
+        self.request_redraw()
+
+    def call_later(
+        self: Map, delay: float, callback: Callable[..., Any], *args: Any
+    ) -> Timer:
+        return self.scheduler.call_later(delay, callback, *args)
 
 
 class MapTile(Location):
@@ -63,19 +95,24 @@ def entity_yx(entity: Entity) -> tuple[float, float]:
 
 
 class MapView(View):
-    def __init__(self: "MapView", map: Map, pos: Optional[Vector2] = None) -> None:
-        from ..game import game
-
+    def __init__(
+        self: "MapView", map: Map, resolution: Vector2, pos: Optional[Vector2] = None
+    ) -> None:
         self.map = map
         self.zoom_ratio = 1.0
-        self._resolution = copy(game.resolution)
+        self._resolution = copy(resolution)
         self.recalculate_sizes()
 
         self.pos = pos or (self.map.size - self.frustrum_size) / 2
 
+        self.map.views.append(self)
+        for layer in self.map.layers.values():
+            layer.subscribe(lambda changes: self.request_redraw())
+
     def recalculate_sizes(self: MapView) -> None:
         self.scaled_tile_size = TILE_SIZE * self.zoom_ratio
         self.frustrum_size = self._resolution / self.scaled_tile_size
+        self.request_redraw()
 
     def screen_to_world(self: MapView, screen_pos: Vector2) -> None:
         return self.pos + screen_pos / self.scaled_tile_size
@@ -86,11 +123,12 @@ class MapView(View):
     def move_pos(self: MapView, movement: Vector2) -> None:
         self.pos += movement
         self.pos.x = clamp(
-            self.pos.x, -1, self.map.size.x - self.frustrum_size.size.x + 1
+            self.pos.x, -1, self.map.size.x - self.frustrum_size.x + 1
         )
         self.pos.y = clamp(
-            self.pos.y, -1, self.map.size.x - self.frustrum_size.size.y + 1
+            self.pos.y, -1, self.map.size.y - self.frustrum_size.y + 1
         )
+        self.request_redraw()
 
     def handle_move(self: MapView, event: EventType) -> None:
         if event.buttons[1]:  # Middle button
@@ -107,7 +145,7 @@ class MapView(View):
     def handle_event(self: MapView, event: EventType) -> bool:
         if event.type == pg.MOUSEMOTION:
             self.handle_move(event)
-        elif event.type:
+        elif event.type == pg.MOUSEWHEEL:
             self.handle_wheel(event)
         else:
             return False
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Optional
+
+from pygame import Vector2
+
+from .globals import REGION_SIZE
+
+
+@dataclass(eq=False)
+class Region:
+    id: int
+    chunk: tuple[int, int]
+    cells: list[int]
+    neighbors: set[int] = field(default_factory=set)
+    room: Optional[int] = None
+
+
+class RegionGrid:
+    """
+    Splits a grid into chunk-local regions of connected passable cells, linked
+    across chunk borders. Rooms are connected components of the region graph.
+    Changes only rebuild the touched chunks and the rooms they belonged to
+    """
+
+    def __init__(
+        self: RegionGrid,
+        size: Vector2,
+        is_passable: Callable[[int], bool],
+        *,
+        chunk_size: int = REGION_SIZE,
+        peek: Optional[Callable[[], LayerChanges]] = None,
+    ) -> None:
+        self.width = int(size.x)
+        self.height = int(size.y)
+        self.is_passable = is_passable
+        self.chunk_size = chunk_size
+        self.peek = peek
+        self.synced_version: Optional[int] = None
+
+        self.cell_regions: list[Optional[int]] = [None] * (self.width * self.height)
+        self.regions: dict[int, Region] = {}
+        self.chunk_regions: dict[tuple[int, int], list[int]] = {}
+        self.rooms: dict[int, set[int]] = {}
+        self.room_sizes: dict[int, int] = {}
+        self.next_region_id = 0
+        self.next_room_id = 0
+
+        self.dirty_chunks: set[tuple[int, int]] = set()
+        self.rebuild()
+
+    def rebuild(self: RegionGrid) -> None:
+        chunks_x = -(-self.width // self.chunk_size)
+        chunks_y = -(-self.height // self.chunk_size)
+        self.dirty_chunks = {(cx, cy) for cx in range(chunks_x) for cy in range(chunks_y)}
+        self.update()
+
+    def mark_dirty(self: RegionGrid, indices: Iterable[int]) -> None:
+        for index in indices:
+            x, y = index % self.width, index // self.width
+            self.dirty_chunks.add((x // self.chunk_size, y // self.chunk_size))
+
+    def handle_changes(self: RegionGrid, changes: LayerChanges) -> None:
+        # A flushed batch that was already peeked at carries the same version
+        if changes.version != self.synced_version:
+            self.synced_version = changes.version
+            self.mark_dirty(changes.indices)
+
+    def update(self: RegionGrid) -> None:
+        if self.peek is not None:
+            self.handle_changes(self.peek())
+
+        if not self.dirty_chunks:
+            return
+
+        affected_rooms: set[int] = set()
+        new_regions: list[int] = []
+
+        for chunk in self.dirty_chunks:
+            for region_id in self.chunk_regions.pop(chunk, []):
+                region = self.regions.pop(region_id)
+                for neighbor_id in region.neighbors:
+                    self.regions[neighbor_id].neighbors.discard(region_id)
+                if region.room is not None:
+                    affected_rooms.add(region.room)
+                    self.rooms[region.room].discard(region_id)
+
+            new_regions.extend(self.flood_chunk(chunk))
+
+        for chunk in self.dirty_chunks:
+            self.link_chunk(chunk)
+
+        self.dirty_chunks.clear()
+
+        # Surviving regions of split or merged rooms are reassigned with the new ones
+        pending = new_regions
+        for room in affected_rooms:
+            pending.extend(self.rooms.pop(room))
+            del self.room_sizes[room]
+        for region_id in pending:
+            self.regions[region_id].room = None
+
+        for region_id in pending:
+            if self.regions[region_id].room is None:
+                self.flood_room(region_id)
+
+    def flood_chunk(self: RegionGrid, chunk: tuple[int, int]) -> list[int]:
+        cx, cy = chunk
+        x0, y0 = cx * self.chunk_size, cy * self.chunk_size
+        x1 = min(x0 + self.chunk_size, self.width)
+        y1 = min(y0 + self.chunk_size, self.height)
+
+        for y in range(y0, y1):
+            for x in range(x0, x1):
+                self.cell_regions[x + y * self.width] = None
+
+        created: list[int] = []
+        for y in range(y0, y1):
+            for x in range(x0, x1):
+                start = x + y * self.width
+                if self.cell_regions[start] is not None or not self.is_passable(start):
+                    continue
+
+                region = Region(self.next_region_id, chunk, [])
+                self.next_region_id += 1
+                self.regions[region.id] = region
+                created.append(region.id)
+
+                self.cell_regions[start] = region.id
+                queue = deque([(x, y)])
+                while queue:
+                    qx, qy = queue.popleft()
+                    region.cells.append(qx + qy * self.width)
+                    for nx, ny in ((qx + 1, qy), (qx - 1, qy), (qx, qy + 1), (qx, qy - 1)):
+                        if not (x0 <= nx < x1 and y0 <= ny < y1):
+                            continue
+                        index = nx + ny * self.width
+                        if self.cell_regions[index] is None and self.is_passable(index):
+                            self.cell_regions[index] = region.id
+                            queue.append((nx, ny))
+
+        self.chunk_regions[chunk] = created
+        return created
+
+    def link_chunk(self: RegionGrid, chunk: tuple[int, int]) -> None:
+        cx, cy = chunk
+        x0, y0 = cx * self.chunk_size, cy * self.chunk_size
+        x1 = min(x0 + self.chunk_size, self.width)
+        y1 = min(y0 + self.chunk_size, self.height)
+
+        border = [(x, y0, x, y0 - 1) for x in range(x0, x1)]
+        border += [(x, y1 - 1, x, y1) for x in range(x0, x1)]
+        border += [(x0, y, x0 - 1, y) for y in range(y0, y1)]
+        border += [(x1 - 1, y, x1, y) for y in range(y0, y1)]
+
+        for x, y, nx, ny in border:
+            if not (0 <= nx < self.width and 0 <= ny < self.height):
+                continue
+            region_id = self.cell_regions[x + y * self.width]
+            neighbor_id = self.cell_regions[nx + ny * self.width]
+            if region_id is not None and neighbor_id is not None:
+                self.regions[region_id].neighbors.add(neighbor_id)
+                self.regions[neighbor_id].neighbors.add(region_id)
+
+    def flood_room(self: RegionGrid, start: int) -> None:
+        room = self.next_room_id
+        self.next_room_id += 1
+        members: set[int] = set()
+        size = 0
+
+        queue = deque([start])
+        self.regions[start].room = room
+        while queue:
+            region = self.regions[queue.popleft()]
+            members.add(region.id)
+            size += len(region.cells)
+            for neighbor_id in region.neighbors:
+                neighbor = self.regions[neighbor_id]
+                if neighbor.room != room:
+                    if neighbor.room is not None and neighbor.room in self.rooms:
+                        # Merged into this room by a new link
+                        old_room = neighbor.room
+                        for region_id in self.rooms.pop(old_room):
+                            self.regions[region_id].room = None
+                        del self.room_sizes[old_room]
+                    neighbor.room = room
+                    queue.append(neighbor_id)
+
+        self.rooms[room] = members
+        self.room_sizes[room] = size
+
+    def region_at(self: RegionGrid, pos: Vector2) -> Optional[Region]:
+        self.update()
+        region_id = self.cell_regions[int(pos.x + self.width * pos.y)]
+        return None if region_id is None else self.regions[region_id]
+
+    def room_at(self: RegionGrid, pos: Vector2) -> Optional[int]:
+        region = self.region_at(pos)
+        return None if region is None else region.room
+
+    def room_size(self: RegionGrid, pos: Vector2) -> int:
+        room = self.room_at(pos)
+        return 0 if room is None else self.room_sizes[room]
+
+    def can_reach(self: RegionGrid, start: Vector2, end: Vector2) -> bool:
+        self.update()
+        start_region = self.cell_regions[int(start.x + self.width * start.y)]
+        end_region = self.cell_regions[int(end.x + self.width * end.y)]
+        return (
+            start_region is not None
+            and end_region is not None
+            and self.regions[start_region].room == self.regions[end_region].room
+        )
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from heapq import heappop, heappush
+from math import ceil
+from typing import Any, Callable, Protocol
+
+TICK_RATE_NORMAL = 1
+TICK_RATE_RARE = 250
+TICK_RATE_LONG = 2000
+
+
+class Tickable(Protocol):
+    tick_rate: int
+
+    def tick(self: Tickable, delta_time: float) -> None:
+        pass
+
+
+class TickGroup:
+    """
+    Objects sharing a tick rate, spread over tick_rate buckets so that only
+    one bucket runs per frame. New objects go to the least loaded bucket
+    """
+
+    def __init__(self: TickGroup, tick_rate: int) -> None:
+        self.tick_rate = tick_rate
+        # Each bucket maps its objects to the time they last ticked
+        self.buckets: list[dict[Tickable, float]] = [{} for _ in range(tick_rate)]
+        # Lazy min-heap of (size, index), stale entries are skipped on pop
+        self.loads: list[tuple[int, int]] = [(0, index) for index in range(tick_rate)]
+
+    def add(self: TickGroup, obj: Tickable, time: float) -> int:
+        while True:
+            size, index = heappop(self.loads)
+            if size == len(self.buckets[index]):
+                break
+
+        self.buckets[index][obj] = time
+        heappush(self.loads, (size + 1, index))
+        return index
+
+    def remove(self: TickGroup, obj: Tickable, index: int) -> None:
+        bucket = self.buckets[index]
+        del bucket[obj]
+        heappush(self.loads, (len(bucket), index))
+
+    def run(self: TickGroup, tick_count: int, time: float) -> None:
+        bucket = self.buckets[tick_count % self.tick_rate]
+
+        for obj, last_run in tuple(bucket.items()):
+            if obj in bucket:
+                bucket[obj] = time
+                obj.tick(time - last_run)
+
+
+@dataclass(eq=False)
+class Timer:
+    expiry: int
+    callback: Callable[..., Any]
+    args: tuple[Any, ...] = ()
+    cancelled: bool = False
+
+    def cancel(self: Timer) -> None:
+        self.cancelled = True
+
+
+class TimerWheel:
+    """
+    Hierarchical timing wheel: each level has 2 ** slot_bits slots, and every
+    slot on level n spans 2 ** (slot_bits * n) ticks of resolution seconds.
+    Timers are cascaded to lower levels as the wheel turns
+    """
+
+    def __init__(
+        self: TimerWheel,
+        *,
+        resolution: float = 1 / 60,
+        slot_bits: int = 6,
+        levels: int = 4,
+    ) -> None:
+        self.resolution = resolution
+        self.slot_bits = slot_bits
+        self.slot_mask = (1 << slot_bits) - 1
+        self.levels: list[list[list[Timer]]] = [
+            [[] for _ in range(1 << slot_bits)] for _ in range(levels)
+        ]
+        self.overflow: list[Timer] = []
+        self.current_tick = 0
+        self.time_carry = 0.0
+
+    def call_later(
+        self: TimerWheel, delay: float, callback: Callable[..., Any], *args: Any
+    ) -> Timer:
+        ticks = max(1, ceil(delay / self.resolution))
+        timer = Timer(self.current_tick + ticks, callback, args)
+        self.insert(timer)
+        return timer
+
+    def insert(self: TimerWheel, timer: Timer) -> None:
+        remaining = timer.expiry - self.current_tick
+        for level, slots in enumerate(self.levels):
+            if remaining < 1 << (self.slot_bits * (level + 1)):
+                index = (timer.expiry >> (self.slot_bits * level)) & self.slot_mask
+                slots[index].append(timer)
+                return
+        self.overflow.append(timer)
+
+    def advance(self: TimerWheel, delta_time: float) -> None:
+        self.time_carry += delta_time
+        steps = int(self.time_carry / self.resolution)
+        self.time_carry -= steps * self.resolution
+
+        for _ in range(steps):
+            self.step()
+
+    def step(self: TimerWheel) -> None:
+        self.current_tick += 1
+
+        for level in range(1, len(self.levels)):
+            if self.current_tick & ((1 << (self.slot_bits * level)) - 1):
+                break
+            self.cascade(level)
+        else:
+            if not self.current_tick & ((1 << (self.slot_bits * len(self.levels))) - 1):
+                overflow, self.overflow = self.overflow, []
+                for timer in overflow:
+                    self.insert(timer)
+
+        slot = self.levels[0][self.current_tick & self.slot_mask]
+        expired = [timer for timer in slot if timer.expiry <= self.current_tick]
+        slot[:] = [timer for timer in slot if timer.expiry > self.current_tick]
+
+        for timer in expired:
+            if not timer.cancelled:
+                timer.callback(*timer.args)
+
+    def cascade(self: TimerWheel, level: int) -> None:
+        index = (self.current_tick >> (self.slot_bits * level)) & self.slot_mask
+        timers = self.levels[level][index]
+        self.levels[level][index] = []
+
+        for timer in timers:
+            if not timer.cancelled:
+                self.insert(timer)
+
+
+class TickScheduler:
+    """
+    Ticks registered objects according to their tick_rate, spreading slower
+    rates evenly across frames, and runs timers scheduled with call_later
+    """
+
+    def __init__(self: TickScheduler) -> None:
+        self.groups: dict[int, TickGroup] = {}
+        self.locations: dict[Tickable, tuple[TickGroup, int]] = {}
+        self.timers = TimerWheel()
+        self.tick_count = 0
+        self.time = 0.0
+
+    def add(self: TickScheduler, obj: Tickable) -> None:
+        tick_rate = getattr(obj, "tick_rate", TICK_RATE_NORMAL)
+        if (group := self.groups.get(tick_rate)) is None:
+            group = self.groups[tick_rate] = TickGroup(tick_rate)
+        self.locations[obj] = (group, group.add(obj, self.time))
+
+    def remove(self: TickScheduler, obj: Tickable) -> None:
+        group, index = self.locations.pop(obj)
+        group.remove(obj, index)
+
+    def call_later(
+        self: TickScheduler, delay: float, callback: Callable[..., Any], *args: Any
+    ) -> Timer:
+        return self.timers.call_later(delay, callback, *args)
+
+    def tick(self: TickScheduler, delta_time: float) -> None:
+        self.time += delta_time
+
+        for group in self.groups.values():
+            group.run(self.tick_count, self.time)
+
+        self.timers.advance(delta_time)
+        self.tick_count += 1
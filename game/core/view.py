@@ -7,6 +7,11 @@ from pygame.event import EventType
 
 
 class View(ABC):
+    redraw_requested: bool = True
+
+    def request_redraw(self: View) -> None:
+        self.redraw_requested = True
+
     @abstractmethod
     def draw(self: View, surface: Surface) -> None:
         pass
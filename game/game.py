@@ -6,14 +6,18 @@ import pygame as pg
 from pygame import Vector2, Surface
 from pygame.time import Clock
 
-from .core.globals import ALPHA_COLOR
+from .core.globals import ALPHA_COLOR, MAX_CATCHUP_STEPS
+from .core.input import coalesce_events
 from .core.map import Map
 from .core.view import View
 
 class Game:
-    def __init__(self: Game, resolution: Vector2, *, max_fps: int = 60) -> None:
+    def __init__(
+        self: Game, resolution: Vector2, *, max_fps: int = 60, idle_fps: int = 10
+    ) -> None:
         self.resolution = resolution
         self.max_fps = max_fps
+        self.idle_fps = idle_fps
 
     def initialize(self: Game) -> None:
         pg.init()
@@ -26,6 +30,7 @@ class Game:
         self.clock = Clock()
 
         self.exit = False
+        self.idle = False
 
         self.maps: dict[str, Map] = {}
         self.active_view: Optional[View] = None
@@ -40,13 +45,19 @@ class Game:
             self.tick()
     
     def read_events(self: Game) -> None:
-        for event in pg.event.get():
+        for event in coalesce_events(pg.event.get()):
             if event.type == pg.QUIT:
                 self.quit()
             else:
                 self.active_view.handle_event(event)
 
     def draw(self: Game) -> None:
+        # Views request a redraw when their contents change, otherwise drop to idle_fps
+        self.idle = not self.active_view.redraw_requested
+        if self.idle:
+            return
+        self.active_view.redraw_requested = False
+
         self.screen.fill((0, 0, 0))
 
         self.active_view.draw(self.screen)
@@ -54,9 +65,19 @@ class Game:
         pg.display.flip()
 
     def tick(self: Game) -> None:
-        self.clock.tick(self.max_fps)
+        self.clock.tick(self.idle_fps if self.idle else self.max_fps)
         
-        delta_time = self.clock.get_time() / 1000.0
+        elapsed = self.clock.get_time() / 1000.0
+
+        # Idle frames only skip drawing, maps still tick at max_fps so that
+        # tick rates and timers keep their cadence. Time beyond the catch-up
+        # limit is dropped so a stall can't snowball into longer frames
+        steps = max(1, round(elapsed * self.max_fps))
+        if steps > MAX_CATCHUP_STEPS:
+            steps = MAX_CATCHUP_STEPS
+            elapsed = steps / self.max_fps
+        delta_time = elapsed / steps
 
-        for map in self.maps.values():
-            map.tick(delta_time)
+        for _ in range(steps):
+            for map in self.maps.values():
+                map.tick(delta_time)
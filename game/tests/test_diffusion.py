@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import unittest
+
+import numpy as np
+from pygame import Vector2
+
+from game.core.diffusion import *
+
+
+class DiffusionFieldTestCase(unittest.TestCase):
+    def test_equilibrium_sleeps(self: DiffusionFieldTestCase):
+        field = DiffusionField(Vector2(30, 20), rate=1.0, initial=21.0, chunk_size=10)
+        field.step(1.0)
+
+        self.assertFalse(field.active.any())
+        self.assertTrue(np.all(field.values == 21.0))
+
+    def test_heat_spreads_and_is_conserved(self: DiffusionFieldTestCase):
+        field = DiffusionField(Vector2(30, 20), rate=1.0, chunk_size=10)
+        field.step(1.0)
+        field.set(5, 5, 100.0)
+
+        field.step(1.0)
+
+        self.assertLess(field.values[5, 5], 100.0)
+        self.assertGreater(field.values[5, 6], 0.0)
+        self.assertAlmostEqual(float(field.values.sum()), 100.0, places=2)
+        self.assertFalse(field.active[1, 2])  # Far chunk never woke up
+
+    def test_conserved_on_chunk_borders(self: DiffusionFieldTestCase):
+        for x, y in [(9, 5), (9, 9), (10, 10), (19, 0)]:
+            field = DiffusionField(Vector2(30, 20), rate=1.0, chunk_size=10)
+            field.step(1.0)
+            field.set(x, y, 100.0)
+
+            field.step(0.2)
+            self.assertAlmostEqual(float(field.values.sum()), 100.0, places=3)
+
+            for _ in range(10):
+                field.step(1.0)
+            self.assertAlmostEqual(float(field.values.sum()), 100.0, places=2)
+
+    def test_gradient_levels_out_before_sleeping(self: DiffusionFieldTestCase):
+        settled = []
+        for delta_time in [1 / 4, 1.0]:
+            field = DiffusionField(Vector2(48, 12), rate=2.0)
+            field.values[:, :24] = 1.0
+
+            for _ in range(100000):
+                if not field.active.any():
+                    break
+                field.step(delta_time)
+
+            self.assertFalse(field.active.any())
+            self.assertLess(float(field.values.max() - field.values.min()), 0.05)
+            self.assertAlmostEqual(float(field.values.mean()), 0.5, places=3)
+            settled.append(field.values.copy())
+
+        # The settled state does not depend on the frame rate
+        self.assertLess(float(np.abs(settled[0] - settled[1]).max()), 0.05)
+
+    def test_substeps_stay_stable(self: DiffusionFieldTestCase):
+        field = DiffusionField(Vector2(10, 10), rate=1.0, chunk_size=5)
+        field.set(4, 4, 100.0)
+
+        field.step(50.0)
+
+        self.assertTrue(np.all(field.values >= 0.0))
+        self.assertTrue(np.all(field.values <= 100.0))
+
+    def test_walls_block_diffusion(self: DiffusionFieldTestCase):
+        field = DiffusionField(Vector2(10, 10), rate=1.0, chunk_size=5)
+        for y in range(10):
+            field.set_open(3, y, False)
+        field.set(0, 0, 100.0)
+
+        for _ in range(20):
+            field.step(1.0)
+
+        self.assertTrue(np.all(field.values[:, 4:] == 0.0))
+        self.assertAlmostEqual(float(field.values[:, :3].sum()), 100.0, places=2)
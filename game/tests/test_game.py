@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame as pg
+from pygame import Surface, Vector2
+from pygame.event import EventType
+
+from game.core.globals import MAX_CATCHUP_STEPS
+from game.game import Game
+from game.core.view import View
+
+
+class DebugView(View):
+    def __init__(self: DebugView) -> None:
+        self.draws = 0
+
+    def draw(self: DebugView, surface: Surface) -> None:
+        self.draws += 1
+
+    def handle_event(self: DebugView, event: EventType) -> bool:
+        return False
+
+
+class DebugClock:
+    def __init__(self: DebugClock, frame_time: int) -> None:
+        self.frame_time = frame_time
+        self.fps: list[int] = []
+
+    def tick(self: DebugClock, fps: int) -> None:
+        self.fps.append(fps)
+
+    def get_time(self: DebugClock) -> int:
+        return self.frame_time
+
+
+class DebugMap:
+    def __init__(self: DebugMap) -> None:
+        self.ticks: list[float] = []
+
+    def tick(self: DebugMap, delta_time: float) -> None:
+        self.ticks.append(delta_time)
+
+
+class GameRedrawTestCase(unittest.TestCase):
+    def setUp(self: GameRedrawTestCase):
+        self.game = Game(Vector2(64, 64), max_fps=60, idle_fps=10)
+        self.game.initialize()
+        self.view = DebugView()
+        self.game.active_view = self.view
+        self.map = DebugMap()
+        self.game.maps["debug"] = self.map
+
+    def tearDown(self: GameRedrawTestCase):
+        pg.quit()
+
+    def test_draw_on_demand(self: GameRedrawTestCase):
+        self.game.draw()
+        self.assertEqual(self.view.draws, 1)
+        self.assertFalse(self.game.idle)
+
+        self.game.draw()
+        self.assertEqual(self.view.draws, 1)
+        self.assertTrue(self.game.idle)
+
+        self.view.request_redraw()
+        self.game.draw()
+        self.assertEqual(self.view.draws, 2)
+        self.assertFalse(self.game.idle)
+
+    def test_active_frame_ticks_once(self: GameRedrawTestCase):
+        self.game.clock = DebugClock(16)
+        self.game.idle = False
+        self.game.tick()
+
+        self.assertEqual(self.game.clock.fps, [60])
+        self.assertEqual(self.map.ticks, [0.016])
+
+    def test_idle_frame_keeps_tick_cadence(self: GameRedrawTestCase):
+        self.game.clock = DebugClock(100)
+        self.game.idle = True
+        self.game.tick()
+
+        self.assertEqual(self.game.clock.fps, [10])
+        self.assertEqual(len(self.map.ticks), 6)
+        self.assertAlmostEqual(sum(self.map.ticks), 0.1)
+
+    def test_stall_catch_up_is_capped(self: GameRedrawTestCase):
+        self.game.clock = DebugClock(3000)
+        self.game.idle = True
+        self.game.tick()
+
+        self.assertEqual(len(self.map.ticks), MAX_CATCHUP_STEPS)
+        for delta_time in self.map.ticks:
+            self.assertAlmostEqual(delta_time, 1 / 60)
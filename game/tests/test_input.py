@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import unittest
+
+import pygame as pg
+
+from game.core.input import *
+
+
+def motion(rel: tuple[int, int], buttons: tuple[int, int, int] = (0, 1, 0)) -> EventType:
+    return pg.event.Event(pg.MOUSEMOTION, pos=(0, 0), rel=rel, buttons=buttons)
+
+
+def wheel(y: int) -> EventType:
+    return pg.event.Event(pg.MOUSEWHEEL, x=0, y=y, flipped=False)
+
+
+class CoalesceEventsTestCase(unittest.TestCase):
+    def test_motion_summed(self: CoalesceEventsTestCase):
+        events = coalesce_events([motion((1, 2)), motion((3, -1)), motion((-2, 4))])
+
+        self.assertEqual(len(events), 1)
+        self.assertEqual(tuple(events[0].rel), (2, 5))
+        self.assertEqual(events[0].buttons, (0, 1, 0))
+
+    def test_wheel_summed(self: CoalesceEventsTestCase):
+        events = coalesce_events([wheel(1), wheel(1), wheel(-3)])
+
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0].y, -1)
+
+    def test_order_kept(self: CoalesceEventsTestCase):
+        key = pg.event.Event(pg.KEYDOWN, key=pg.K_a)
+        events = coalesce_events(
+            [motion((1, 0)), motion((1, 0)), key, motion((1, 0)), wheel(1), wheel(2)]
+        )
+
+        self.assertEqual(
+            [event.type for event in events],
+            [pg.MOUSEMOTION, pg.KEYDOWN, pg.MOUSEMOTION, pg.MOUSEWHEEL],
+        )
+        self.assertEqual(tuple(events[0].rel), (2, 0))
+        self.assertEqual(events[3].y, 3)
+
+    def test_button_change_not_merged(self: CoalesceEventsTestCase):
+        events = coalesce_events([motion((1, 0), (0, 0, 0)), motion((1, 0))])
+
+        self.assertEqual(len(events), 2)
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import unittest
+
+import pygame as pg
+from typing import Any
+
+from pygame import Surface, Vector2
+from pygame.event import EventType
+
+from game.core.buildings import SimpleBuilding
+from game.core.map import *
+from game.core.map.layers.map_layer import LayerChanges
+from game.core.input import coalesce_events
+from game.core.view import View
+
+
+class DebugView(View):
+    def draw(self: DebugView, surface: Surface) -> None:
+        pass
+
+    def handle_event(self: DebugView, event: EventType) -> bool:
+        return False
+
+
+class DebugEntity:
+    tick_rate = 1
+
+    def __init__(self: DebugEntity, map: Map, velocity: Vector2) -> None:
+        self.id = "debug"
+        self.map = map
+        self.velocity = velocity
+        self.data = {"location": MapTile(map, Vector2(1, 1))}
+
+    def tick(self: DebugEntity, delta_time: float) -> None:
+        if self.velocity:
+            position = self.data["location"].position + self.velocity * delta_time
+            self.map.move_entity(self, position)
+
+
+class DebugWall(SimpleBuilding):
+    sprite = None
+    speed_modifier = 0.0
+    impassable = True
+
+    def __init__(self: DebugWall, **data: Any) -> None:
+        super().__init__(location=None, **data)
+
+
+class MapRegionsTestCase(unittest.TestCase):
+    def setUp(self: MapRegionsTestCase):
+        self.map = Map(Vector2(8, 8))
+        self.buildings = self.map.layers["buildings"]
+
+    def test_queries_do_not_flush(self: MapRegionsTestCase):
+        batches: list[LayerChanges] = []
+        self.buildings.subscribe(batches.append)
+
+        for y in range(7):
+            self.buildings.set_pos(Vector2(3, y), DebugWall())
+            self.assertEqual(self.map.regions.room_size(Vector2(0, 0)), 63 - y)
+        self.buildings.set_pos(Vector2(3, 7), DebugWall())
+        self.assertEqual(self.map.regions.room_size(Vector2(0, 0)), 24)
+        self.assertFalse(self.map.regions.can_reach(Vector2(0, 0), Vector2(7, 7)))
+        self.assertEqual(batches, [])
+
+        self.buildings.flush_changes()
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(len(batches[0].indices), 8)
+        self.assertEqual(self.map.regions.dirty_chunks, set())
+
+
+    def test_add_and_remove_building(self: MapRegionsTestCase):
+        temperature = self.map.layers["temperature"]
+
+        for y in range(8):
+            self.buildings.add_building(Vector2(3, y), DebugWall())
+        self.assertFalse(self.map.regions.can_reach(Vector2(0, 0), Vector2(7, 7)))
+
+        self.map.tick(1 / 60)
+        self.assertFalse(temperature.data.open[:8, 3].any())
+        self.assertTrue(temperature.data.open[:8, 4].all())
+
+        self.buildings.remove_building(Vector2(3, 5))
+        self.assertTrue(self.map.regions.can_reach(Vector2(0, 0), Vector2(7, 7)))
+
+        self.map.tick(1 / 60)
+        self.assertTrue(temperature.data.open[5, 3])
+        self.assertIsNone(self.buildings.get_pos(Vector2(3, 5)))
+
+class MapRedrawTestCase(unittest.TestCase):
+    def setUp(self: MapRedrawTestCase):
+        self.map = Map(Vector2(8, 8))
+        self.view = DebugView()
+        self.map.views.append(self.view)
+        self.map.tick(1 / 60)
+        self.view.redraw_requested = False
+
+    def test_idle_map_needs_no_redraw(self: MapRedrawTestCase):
+        for _ in range(10):
+            self.map.tick(1 / 60)
+
+        self.assertFalse(self.view.redraw_requested)
+
+    def test_moving_entity_keeps_redrawing(self: MapRedrawTestCase):
+        entity = DebugEntity(self.map, Vector2(1, 0))
+        self.map.add_entity(entity)
+        self.assertTrue(self.view.redraw_requested)
+
+        for _ in range(10):
+            self.view.redraw_requested = False
+            self.map.tick(1 / 60)
+            self.assertTrue(self.view.redraw_requested)
+
+        entity.velocity = Vector2(0, 0)
+        self.map.tick(1 / 60)
+        self.view.redraw_requested = False
+        self.map.tick(1 / 60)
+        self.assertFalse(self.view.redraw_requested)
+
+        self.map.remove_entity(entity)
+        self.assertTrue(self.view.redraw_requested)
+
+
+class MapViewTestCase(unittest.TestCase):
+    def setUp(self: MapViewTestCase):
+        self.map = Map(Vector2(100, 60))
+        self.view = MapView(self.map, Vector2(640, 480))
+        self.view.redraw_requested = False
+
+    def handle(self: MapViewTestCase, events: list[EventType]) -> None:
+        for event in coalesce_events(events):
+            self.assertTrue(self.view.handle_event(event))
+
+    def test_drag_moves_and_redraws(self: MapViewTestCase):
+        start = self.view.pos.copy()
+        self.handle(
+            [
+                pg.event.Event(
+                    pg.MOUSEMOTION, pos=(0, 0), rel=(-16, 0), buttons=(0, 1, 0)
+                )
+                for _ in range(4)
+            ]
+        )
+
+        self.assertTrue(self.view.redraw_requested)
+        self.assertEqual(self.view.pos, start + Vector2(2, 0))
+
+    def test_drag_is_clamped(self: MapViewTestCase):
+        self.handle(
+            [
+                pg.event.Event(
+                    pg.MOUSEMOTION, pos=(0, 0), rel=(-10000, -10000), buttons=(0, 1, 0)
+                )
+            ]
+        )
+
+        self.assertEqual(
+            self.view.pos, self.map.size - self.view.frustrum_size + Vector2(1, 1)
+        )
+
+    def test_hover_does_not_redraw(self: MapViewTestCase):
+        self.handle(
+            [pg.event.Event(pg.MOUSEMOTION, pos=(0, 0), rel=(5, 5), buttons=(0, 0, 0))]
+        )
+
+        self.assertFalse(self.view.redraw_requested)
+
+    def test_wheel_zooms_and_redraws(self: MapViewTestCase):
+        self.handle(
+            [pg.event.Event(pg.MOUSEWHEEL, x=0, y=1, flipped=False) for _ in range(5)]
+        )
+
+        self.assertTrue(self.view.redraw_requested)
+        self.assertAlmostEqual(self.view.zoom_ratio, 1.2)
+
+    def test_layer_change_redraws(self: MapViewTestCase):
+        self.map.layers["temperature"].set_pos(Vector2(0, 0), 30.0)
+        self.map.tick(1 / 60)
+
+        self.assertTrue(self.view.redraw_requested)
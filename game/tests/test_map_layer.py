@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import unittest
+
+from pygame import Rect, Vector2
+
+from game.core.map.layers.map_layer import *
+
+
+class StubMap:
+    def __init__(self: StubMap, size: Vector2) -> None:
+        self.size = size
+
+
+class DebugLayer(MapLayer[int]):
+    __layer_name__ = "debug"
+    default_elem = 0
+
+
+class MapLayerJournalTestCase(unittest.TestCase):
+    def setUp(self: MapLayerJournalTestCase):
+        self.layer = DebugLayer(StubMap(Vector2(5, 4)))
+        self.batches: list[LayerChanges] = []
+        self.layer.subscribe(self.batches.append)
+
+    def test_one_batch_per_flush(self: MapLayerJournalTestCase):
+        self.layer.set_pos(Vector2(1, 2), 5)
+        self.layer.set_pos(Vector2(1, 2), 6)
+        self.layer.set_pos(Vector2(3, 0), 1)
+        self.layer.flush_changes()
+
+        self.assertEqual(len(self.batches), 1)
+        self.assertEqual(self.batches[0].indices, frozenset({11, 3}))
+        self.assertEqual(self.layer.get_pos(Vector2(1, 2)), 6)
+
+    def test_no_callback_when_clean(self: MapLayerJournalTestCase):
+        self.layer.flush_changes()
+        self.layer.set_pos(Vector2(0, 0), 1)
+        self.layer.flush_changes()
+        self.layer.flush_changes()
+
+        self.assertEqual(len(self.batches), 1)
+
+    def test_version_increments(self: MapLayerJournalTestCase):
+        self.assertEqual(self.layer.version, 0)
+        self.layer.set_pos(Vector2(0, 0), 1)
+        self.layer.mark_dirty(Vector2(1, 0))
+        self.layer.flush_changes()
+
+        self.assertEqual(self.layer.version, 2)
+        self.assertEqual(self.batches[0].version, 2)
+
+    def test_writes_in_subscriber_go_to_next_batch(self: MapLayerJournalTestCase):
+        def write_back(changes: LayerChanges) -> None:
+            if Vector2(4, 3) not in changes.positions():
+                self.layer.set_pos(Vector2(4, 3), 9)
+
+        self.layer.subscribe(write_back)
+        self.layer.set_pos(Vector2(0, 0), 1)
+        self.layer.flush_changes()
+
+        self.assertEqual(len(self.batches), 1)
+        self.assertEqual(self.batches[0].indices, frozenset({0}))
+
+        self.layer.flush_changes()
+
+        self.assertEqual(len(self.batches), 2)
+        self.assertEqual(self.batches[1].indices, frozenset({19}))
+
+    def test_unsubscribe(self: MapLayerJournalTestCase):
+        self.layer.unsubscribe(self.batches.append)
+        self.layer.set_pos(Vector2(0, 0), 1)
+        self.layer.flush_changes()
+
+        self.assertEqual(self.batches, [])
+
+    def test_positions_and_bounds(self: MapLayerJournalTestCase):
+        self.layer.set_pos(Vector2(1, 2), 1)
+        self.layer.set_pos(Vector2(3, 0), 1)
+        self.layer.flush_changes()
+        changes = self.batches[0]
+
+        self.assertEqual(
+            sorted((int(pos.x), int(pos.y)) for pos in changes.positions()),
+            [(1, 2), (3, 0)],
+        )
+        self.assertEqual(changes.bounds, Rect(1, 0, 3, 3))
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import unittest
+
+from pygame import Vector2
+
+from game.core.regions import *
+
+
+class RegionGridTestCase(unittest.TestCase):
+    def setUp(self: RegionGridTestCase):
+        self.size = Vector2(10, 8)
+        self.walls: set[int] = set()
+        self.grid = RegionGrid(
+            self.size, lambda index: index not in self.walls, chunk_size=4
+        )
+
+    def set_wall(self: RegionGridTestCase, x: int, y: int, wall: bool = True):
+        index = int(x + self.size.x * y)
+        if wall:
+            self.walls.add(index)
+        else:
+            self.walls.discard(index)
+        self.grid.mark_dirty([index])
+
+    def test_open_map(self: RegionGridTestCase):
+        self.assertEqual(len(self.grid.regions), 6)  # 3x2 chunks
+        self.assertEqual(len(self.grid.rooms), 1)
+        self.assertEqual(self.grid.room_size(Vector2(0, 0)), 80)
+        self.assertTrue(self.grid.can_reach(Vector2(0, 0), Vector2(9, 7)))
+
+    def test_split_and_merge(self: RegionGridTestCase):
+        for y in range(8):
+            self.set_wall(5, y)
+
+        self.assertFalse(self.grid.can_reach(Vector2(0, 0), Vector2(9, 7)))
+        self.assertEqual(self.grid.room_size(Vector2(0, 0)), 40)
+        self.assertEqual(self.grid.room_size(Vector2(9, 7)), 32)
+        self.assertIsNone(self.grid.room_at(Vector2(5, 3)))
+        self.assertEqual(self.grid.room_size(Vector2(5, 3)), 0)
+
+        self.set_wall(5, 6, False)
+
+        self.assertTrue(self.grid.can_reach(Vector2(0, 0), Vector2(9, 7)))
+        self.assertEqual(self.grid.room_size(Vector2(0, 0)), 73)
+
+    def test_enclosed_room(self: RegionGridTestCase):
+        for x in range(1, 4):
+            self.set_wall(x, 1)
+            self.set_wall(x, 3)
+        self.set_wall(1, 2)
+        self.set_wall(3, 2)
+
+        self.assertEqual(self.grid.room_size(Vector2(2, 2)), 1)
+        self.assertFalse(self.grid.can_reach(Vector2(2, 2), Vector2(0, 0)))
+        self.assertEqual(self.grid.room_size(Vector2(0, 0)), 80 - 9)
+
+    def test_only_dirty_chunks_rebuilt(self: RegionGridTestCase):
+        untouched = self.grid.region_at(Vector2(9, 7))
+        self.set_wall(0, 0)
+        self.grid.update()
+
+        self.assertIs(self.grid.region_at(Vector2(9, 7)), untouched)
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import unittest
+
+from game.core.scheduling import *
+
+
+class Counter:
+    def __init__(self: Counter, tick_rate: int) -> None:
+        self.tick_rate = tick_rate
+        self.ticks: list[float] = []
+
+    def tick(self: Counter, delta_time: float) -> None:
+        self.ticks.append(delta_time)
+
+
+class TickSchedulerTestCase(unittest.TestCase):
+    def test_tick_rates(self: TickSchedulerTestCase):
+        scheduler = TickScheduler()
+        every_frame = Counter(TICK_RATE_NORMAL)
+        every_tenth = Counter(10)
+        scheduler.add(every_frame)
+        scheduler.add(every_tenth)
+
+        for _ in range(30):
+            scheduler.tick(0.5)
+
+        self.assertEqual(len(every_frame.ticks), 30)
+        self.assertEqual(len(every_tenth.ticks), 3)
+        self.assertEqual(every_tenth.ticks[1:], [5.0, 5.0])
+
+    def test_spread_across_frames(self: TickSchedulerTestCase):
+        scheduler = TickScheduler()
+        counters = [Counter(4) for _ in range(8)]
+        for counter in counters:
+            scheduler.add(counter)
+
+        per_frame = []
+        for _ in range(4):
+            before = sum(len(counter.ticks) for counter in counters)
+            scheduler.tick(1.0)
+            per_frame.append(sum(len(counter.ticks) for counter in counters) - before)
+
+        self.assertEqual(per_frame, [2, 2, 2, 2])
+
+    def test_late_group_delta(self: TickSchedulerTestCase):
+        scheduler = TickScheduler()
+        scheduler.add(Counter(TICK_RATE_NORMAL))
+        for _ in range(600):
+            scheduler.tick(1 / 60)
+
+        rare = Counter(TICK_RATE_RARE)
+        scheduler.add(rare)
+        for _ in range(TICK_RATE_RARE):
+            scheduler.tick(1 / 60)
+
+        self.assertEqual(len(rare.ticks), 1)
+        self.assertLessEqual(rare.ticks[0], TICK_RATE_RARE / 60 + 1e-6)
+
+    def test_churn_stays_balanced(self: TickSchedulerTestCase):
+        scheduler = TickScheduler()
+        counters = [Counter(4) for _ in range(8)]
+        for counter in counters:
+            scheduler.add(counter)
+
+        # Empty bucket 0 then refill, rotation would have piled onto other buckets
+        for counter in counters[0::4]:
+            scheduler.remove(counter)
+        for _ in range(2):
+            scheduler.add(Counter(4))
+        group = scheduler.groups[4]
+
+        self.assertEqual([len(bucket) for bucket in group.buckets], [2, 2, 2, 2])
+
+    def test_late_object_delta(self: TickSchedulerTestCase):
+        scheduler = TickScheduler()
+        scheduler.add(Counter(2))
+        scheduler.add(Counter(2))
+        scheduler.tick(1.0)
+        scheduler.tick(1.0)
+
+        late = Counter(2)  # Joins the bucket that last ran one second ago
+        scheduler.add(late)
+        scheduler.tick(1.0)
+
+        self.assertEqual(late.ticks, [1.0])
+
+    def test_remove(self: TickSchedulerTestCase):
+        scheduler = TickScheduler()
+        counter = Counter(TICK_RATE_NORMAL)
+        scheduler.add(counter)
+        scheduler.tick(1.0)
+        scheduler.remove(counter)
+        scheduler.tick(1.0)
+
+        self.assertEqual(len(counter.ticks), 1)
+
+
+class TimerWheelTestCase(unittest.TestCase):
+    def test_call_later(self: TimerWheelTestCase):
+        wheel = TimerWheel(resolution=1.0)
+        fired: list[tuple[int, int]] = []
+
+        for delay in [1, 5, 63, 64, 65, 4095, 4096, 5000, 100000]:
+            wheel.call_later(delay, lambda d: fired.append((wheel.current_tick, d)), delay)
+
+        wheel.advance(100000.0)
+
+        self.assertEqual(
+            fired, [(d, d) for d in [1, 5, 63, 64, 65, 4095, 4096, 5000, 100000]]
+        )
+
+    def test_cancel(self: TimerWheelTestCase):
+        wheel = TimerWheel(resolution=1.0)
+        fired: list[str] = []
+        timer = wheel.call_later(100, fired.append, "cancelled")
+        wheel.call_later(200, fired.append, "kept")
+        timer.cancel()
+
+        wheel.advance(500.0)
+
+        self.assertEqual(fired, ["kept"])